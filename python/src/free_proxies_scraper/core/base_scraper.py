@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
 import asyncio
+import time
+from contextlib import nullcontext
 from typing import Dict, List, Any, Optional
 import logging
 
+from ..utils import tracing
+from .pipeline import ScrapePipeline
+
 
 class BaseScraper(ABC):
     """
@@ -21,6 +26,9 @@ class BaseScraper(ABC):
         self.parser = None
         self.storage = None
         self.proxy_manager = None
+        self.tracer = None
+        # Pipeline of the last scrape_pipeline call, kept for its queue depths
+        self.pipeline: Optional[ScrapePipeline] = None
 
     @abstractmethod
     async def fetch(self, url: str, **kwargs) -> Any:
@@ -39,13 +47,14 @@ class BaseScraper(ABC):
         Returns:
             Processed data
         """
-        raw_data = await self.fetch(url, **kwargs)
-        if raw_data and self.parser:
-            parsed_data = await self.parser.parse(raw_data)
-            if self.storage:
-                await self.storage.save(parsed_data)
-            return parsed_data
-        return raw_data
+        with self._tracing(), tracing.span("scrape", url=url):
+            raw_data = await self.fetch(url, **kwargs)
+            if raw_data and self.parser:
+                parsed_data = await self.parser.parse(raw_data)
+                if self.storage:
+                    await self.storage.save(parsed_data)
+                return parsed_data
+            return raw_data
 
     async def scrape_many(self, urls: List[str], concurrency: int = 5, **kwargs) -> List[Any]:
         """
@@ -57,15 +66,33 @@ class BaseScraper(ABC):
         semaphore = asyncio.Semaphore(concurrency)
 
         async def _scrape_with_semaphore(url):
+            waiting = time.perf_counter()
             async with semaphore:
+                tracing.record("scrape_many.wait", time.perf_counter() - waiting)
                 try:
                     return await self.scrape(url, **kwargs)
                 except Exception as e:
                     self.logger.error(f"Error scraping {url}: {e}")
                     return None
 
-        tasks = [_scrape_with_semaphore(url) for url in urls]
-        return await asyncio.gather(*tasks)
+        with self._tracing():
+            tasks = [_scrape_with_semaphore(url) for url in urls]
+            return await asyncio.gather(*tasks)
+
+    async def scrape_pipeline(self, urls: List[str], fetch_workers: int = 5, parse_workers: int = 2,
+                              store_workers: int = 1, queue_size: int = 100, store_batch_size: int = 1,
+                              **kwargs) -> List[Any]:
+        """
+        Scrape many URLs with fetch, parse and store running as separate stages,
+        so concurrency slots are not held during parsing and disk writes.
+        The pipeline is kept in self.pipeline, see its max_depths and queue_depths()
+
+        Returns:
+            Processed data list
+        """
+        self.pipeline = ScrapePipeline(self, fetch_workers, parse_workers, store_workers, queue_size, store_batch_size)
+        with self._tracing():
+            return await self.pipeline.run(urls, **kwargs)
 
     def set_parser(self, parser):
         self.parser = parser
@@ -78,3 +105,16 @@ class BaseScraper(ABC):
     def set_proxy_manager(self, proxy_manager):
         self.proxy_manager = proxy_manager
         return self
+
+    def set_tracer(self, tracer):
+        """
+        Record per-stage timing spans of every call with tracer, None disables it
+        """
+        self.tracer = tracer
+        return self
+
+    def _tracing(self):
+        # Activate self.tracer unless a tracer is already active
+        if self.tracer is None or tracing.get_tracer() is not None:
+            return nullcontext()
+        return self.tracer.activate()
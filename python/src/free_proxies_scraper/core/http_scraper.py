@@ -5,10 +5,14 @@ import time
 import os
 import csv
 
+from urllib.parse import urlsplit
 from typing import Dict, Any, Optional, Callable, List, Union
 from .base_scraper import BaseScraper
-from ..proxy.proxy_manager import ProxyManager
+from ..proxy.proxy_manager import ProxyManager, NoProxyAvailableError
 from ..utils.user_agent import UserAgentManager
+from ..utils.timeout_policy import AdaptiveTimeoutPolicy
+from ..utils import tracing
+from ..utils.compression import accept_encoding, infer_compression, open_text
 from ..parser.html_parser import HtmlParser
 from ..storage.csv_storage import CsvStorage
 
@@ -16,7 +20,7 @@ from ..storage.csv_storage import CsvStorage
 class HttpScraper(BaseScraper):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None, parse_func=None, save_file="tmp.csv", 
-                 check_url="https://google.com/", countries=["US", "CA"], fieldnames: Optional[List[str]] = None):
+                 check_url="https://google.com/", countries=None, fieldnames: Optional[List[str]] = None):
         """
         Args:
             config: Config dict including parameters:
@@ -24,13 +28,28 @@ class HttpScraper(BaseScraper):
                 - retry_times 
                 - retry_delay: seconds
                 - headers
+                - adaptive_timeout: derive per proxy/host deadlines from
+                  observed latencies, bounded by timeout (default True)
+                - min_timeout: floor for adaptive deadlines in seconds
+                - proxy_sources: proxy source names to aggregate, see
+                  proxy.proxy_sources (default: free-proxy-list.net per country)
+                - proxy_country: only use proxies from this country code
+                - sticky_proxies: keep the same proxy per host across requests
         """
         super().__init__(config)
         self.timeout = aiohttp.ClientTimeout(
             total=self.config.get('timeout', 10))
+        self.timeout_policy = None
+        if self.config.get('adaptive_timeout', True):
+            self.timeout_policy = AdaptiveTimeoutPolicy(
+                default_timeout=self.config.get('timeout', 10),
+                min_timeout=self.config.get('min_timeout', 1.0))
         self.retry_times = self.config.get('retry_times', 3)
         self.retry_delay = self.config.get('retry_delay', 2)
-        self.headers = self.config.get('headers', {})
+        self.headers = dict(self.config.get('headers', {}))
+        # Advertise every codec aiohttp can decode here, brotli/zstd included
+        if not any(k.lower() == "accept-encoding" for k in self.headers):
+            self.headers["Accept-Encoding"] = accept_encoding()
         self.user_agent_manager = UserAgentManager()
         self.session = None
         self.fieldnames = fieldnames
@@ -47,17 +66,36 @@ class HttpScraper(BaseScraper):
 
     async def fetch(self, url: str, **kwargs) -> Optional[str]:
         """
+        Args:
+            proxy_country: Overrides the proxy_country config for this call
+            sticky_proxy: Overrides the sticky_proxies config for this call
+
         Returns:
             Web Content in string, return None otherwise
         """
+        with self._tracing(), tracing.span("fetch", url=url):
+            return await self._fetch(url, **kwargs)
+
+    async def _fetch(self, url: str, **kwargs) -> Optional[str]:
         session = await self._ensure_session()
         headers = dict(self.headers)
         headers.update({"User-Agent": self.user_agent_manager.get_random()})
+        host = urlsplit(url).netloc
+        proxy_country = kwargs.pop("proxy_country", self.config.get("proxy_country"))
+        sticky = kwargs.pop("sticky_proxy", self.config.get("sticky_proxies", False))
 
         for attempt in range(self.retry_times):
             proxy = None
             if self.proxy_manager:
-                proxy = await self.proxy_manager.get_proxy()
+                try:
+                    proxy = await self.proxy_manager.get_proxy(
+                        country=proxy_country, host=host if sticky else None)
+                except NoProxyAvailableError as e:
+                    # Skip the attempt rather than send it from the wrong region
+                    self.logger.warning(f"Skipping attempt for {url}: {e}")
+                    with tracing.span("fetch.backoff"):
+                        await asyncio.sleep(self.retry_delay * (1 + attempt * 0.5))
+                    continue
 
             try:
                 self.logger.debug(
@@ -70,44 +108,66 @@ class HttpScraper(BaseScraper):
                     "proxy": proxy,
                     **kwargs
                 }
-
-                async with session.get(url, **request_kwargs) as response:
-                    if response.status == 200:
-                        self.logger.debug(f"Successfully fetched {url}")
-                        return await response.text()
-
-                    if response.status == 429:  # Too Many Requests
-                        self.logger.warning(f"Rate limited (429) for {url}")
-                        if proxy and self.proxy_manager:
-                            self.proxy_manager.report_proxy_failure(proxy)
-                        wait_time = 5 + attempt * 10
-                        self.logger.info(f"Waiting {wait_time}s before retry")
-                        await asyncio.sleep(wait_time)
-                        continue
-
-                    if response.status == 403:  # Forbidden
-                        self.logger.warning(
-                            f"Access forbidden (403) for {url}")
-                        if proxy and self.proxy_manager:
-                            self.proxy_manager.report_proxy_failure(proxy)
-                        await asyncio.sleep(self.retry_delay)
-                        continue
-
-                    # Other errors
-                    self.logger.error(
-                        f"HTTP error {response.status} for {url}")
-                    if proxy and self.proxy_manager:
-                        self.proxy_manager.report_proxy_failure(proxy)
+                adaptive = self.timeout_policy and "timeout" not in kwargs
+                if adaptive:
+                    request_kwargs["timeout"] = self.timeout_policy.get_timeout(
+                        proxy, host)
+
+                start = time.monotonic()
+                backoff = None
+                with tracing.span("fetch.request", proxy=proxy) as span_attrs:
+                    async with session.get(url, **request_kwargs) as response:
+                        span_attrs["status"] = response.status
+                        if response.status == 200:
+                            headers_at = time.monotonic()
+                            text = await response.text()
+                            if adaptive:
+                                self.timeout_policy.record(
+                                    headers_at - start, time.monotonic() - headers_at,
+                                    proxy, host)
+                            self.logger.debug(f"Successfully fetched {url}")
+                            return text
+
+                        if response.status == 429:  # Too Many Requests
+                            self.logger.warning(f"Rate limited (429) for {url}")
+                            if proxy and self.proxy_manager:
+                                self.proxy_manager.report_proxy_failure(proxy)
+                            backoff = 5 + attempt * 10
+                            self.logger.info(f"Waiting {backoff}s before retry")
+
+                        elif response.status == 403:  # Forbidden
+                            self.logger.warning(
+                                f"Access forbidden (403) for {url}")
+                            if proxy and self.proxy_manager:
+                                self.proxy_manager.report_proxy_failure(proxy)
+                            backoff = self.retry_delay
+
+                        else:
+                            # Other errors
+                            self.logger.error(
+                                f"HTTP error {response.status} for {url}")
+                            if proxy and self.proxy_manager:
+                                self.proxy_manager.report_proxy_failure(proxy)
+
+                # Backoff is kept out of the request span so it is not counted as network time
+                if backoff is not None:
+                    with tracing.span("fetch.backoff", status=response.status):
+                        await asyncio.sleep(backoff)
+                    continue
 
             except (aiohttp.ClientError, asyncio.TimeoutError) as e:
                 self.logger.error(f"Request error for {url}: {str(e)}")
                 if proxy and self.proxy_manager:
                     self.proxy_manager.report_proxy_failure(proxy)
+                if adaptive and isinstance(e, asyncio.TimeoutError):
+                    # Censored sample, lets a too tight deadline loosen again
+                    self.timeout_policy.record_timeout(request_kwargs["timeout"], proxy, host)
 
             # Retry after random time
             retry_delay = self.retry_delay * (1 + attempt * 0.5)
             retry_delay += random.uniform(0, 1)
-            time.sleep(retry_delay)
+            with tracing.span("fetch.backoff"):
+                await asyncio.sleep(retry_delay)
 
         self.logger.error(f"Max retries reached for {url}")
         return None
@@ -120,7 +180,10 @@ class HttpScraper(BaseScraper):
     def initialize_scraper(self, parse_func: Optional[Callable], save_file, check_url, countries):
         parser = HtmlParser(parse_func=parse_func)
         storage = CsvStorage(file_path=save_file)
-        proxy_manager = ProxyManager(check_url, countries)
+        # Proxy validation and fetches learn from the same latency samples
+        proxy_manager = ProxyManager(
+            check_url, countries, sources=self.config.get('proxy_sources'),
+            timeout_policy=self.timeout_policy)
         self.set_parser(parser)
         self.set_storage(storage)
         self.set_proxy_manager(proxy_manager)
@@ -133,15 +196,18 @@ class HttpScraper(BaseScraper):
         semaphore = asyncio.Semaphore(5)
 
         async def fetch_and_parse(url: str):
+            waiting = time.perf_counter()
             async with semaphore:
+                tracing.record("get_parsed_data.wait", time.perf_counter() - waiting)
                 html = await self.fetch(url)
                 if not html:
                     return []
                 data = await self.parser.parse(html, url, *args, **kwargs)
                 return data or []
 
-        tasks = [fetch_and_parse(u) for u in urls]
-        results = await asyncio.gather(*tasks)
+        with self._tracing():
+            tasks = [fetch_and_parse(u) for u in urls]
+            results = await asyncio.gather(*tasks)
         return dict(zip(urls, results))
 
     async def save(self, data, csv_path: str = "", mode: str = "a") -> bool:
@@ -157,6 +223,7 @@ class HttpScraper(BaseScraper):
     async def _save(self, data: Any, csv_path: str, mode: str = "a") -> bool:
         """
         Save data (a dict, list of dicts, or list of rows) to CSV at self.csv_path.
+        Paths ending in .gz or .zst are written compressed.
         Returns True on success, False on error or empty data.
         """
         if not data:
@@ -204,7 +271,7 @@ class HttpScraper(BaseScraper):
         write_header: bool,
         csv_path,
     ):
-        with open(csv_path, write_mode, newline="", encoding="utf-8") as f:
+        with open_text(csv_path, write_mode, infer_compression(csv_path)) as f:
             if isinstance(data[0], dict):
                 writer = csv.DictWriter(f, fieldnames=self.fieldnames)
                 if write_header:
@@ -0,0 +1,193 @@
+import asyncio
+import logging
+import time
+from typing import Any, Dict, List, Optional
+
+from ..utils import tracing
+
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class ScrapePipeline:
+    """
+    Run fetch, parse and store as separate stages joined by bounded queues.
+
+    Fetch workers only hold a network slot while downloading, parsing and
+    storage run in their own worker pools, and the bounded queues apply
+    back pressure when a downstream stage falls behind.
+
+    Every put is traced as "pipeline.<stage>.put_wait" with the queue depth
+    after the put as its depth attribute, max_depths keeps the peaks.
+    """
+
+    def __init__(
+        self,
+        scraper,
+        fetch_workers: int = 5,
+        parse_workers: int = 2,
+        store_workers: int = 1,
+        queue_size: int = 100,
+        store_batch_size: int = 1
+    ):
+        """
+        Args:
+            scraper: Scraper providing fetch, parser and storage
+            fetch_workers: Concurrent downloads
+            parse_workers: Concurrent parse calls
+            store_workers: Store workers. Their save calls are serialized unless
+                the storage sets supports_concurrent_save
+            queue_size: Capacity of the parse and store queues
+            store_batch_size: Parsed lists merged into one storage.save call
+        """
+        if min(fetch_workers, parse_workers, store_workers, queue_size, store_batch_size) < 1:
+            raise ValueError("Worker counts, queue_size and store_batch_size should be positive.")
+        self.scraper = scraper
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
+        self.store_workers = store_workers
+        self.queue_size = queue_size
+        self.store_batch_size = store_batch_size
+        self.logger = logging.getLogger("ScrapePipeline")
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._store_lock: Optional[asyncio.Lock] = None
+        self.max_depths: Dict[str, int] = {}
+
+    def queue_depths(self) -> Dict[str, int]:
+        """
+        Returns:
+            Current number of items waiting in front of each stage
+        """
+        return {stage: queue.qsize() for stage, queue in self._queues.items()}
+
+    async def run(self, urls: List[str], **kwargs) -> List[Any]:
+        """
+        Scrape urls through the pipeline.
+
+        Returns:
+            Processed data list in the order of urls, None for failed URLs
+        """
+        self._queues = {
+            "fetch": asyncio.Queue(),
+            "parse": asyncio.Queue(self.queue_size),
+            "store": asyncio.Queue(self.queue_size),
+        }
+        self.max_depths = {stage: 0 for stage in self._queues}
+        # e.g. CsvStorage decides between writing a header and appending per call
+        self._store_lock = None
+        if not getattr(self.scraper.storage, "supports_concurrent_save", False):
+            self._store_lock = asyncio.Lock()
+        results: List[Any] = [None] * len(urls)
+
+        fetchers = [asyncio.ensure_future(self._fetch_worker(results, kwargs)) for _ in range(self.fetch_workers)]
+        parsers = [asyncio.ensure_future(self._parse_worker(results)) for _ in range(self.parse_workers)]
+        storers = [asyncio.ensure_future(self._store_worker()) for _ in range(self.store_workers)]
+
+        try:
+            for index, url in enumerate(urls):
+                await self._put("fetch", (index, url))
+            await self._close_stage("fetch", fetchers)
+            await self._close_stage("parse", parsers)
+            await self._close_stage("store", storers)
+        finally:
+            for task in fetchers + parsers + storers:
+                if not task.done():
+                    task.cancel()
+
+        self.logger.debug(f"Pipeline finished, max queue depths: {self.max_depths}")
+        return results
+
+    async def _close_stage(self, stage: str, workers: List[asyncio.Future]):
+        for _ in workers:
+            await self._queues[stage].put(_DONE)
+        await asyncio.gather(*workers)
+
+    async def _put(self, stage: str, item: Any):
+        waiting = time.perf_counter()
+        queue = self._queues[stage]
+        await queue.put((time.perf_counter(), item))
+        depth = queue.qsize()
+        tracing.record(f"pipeline.{stage}.put_wait", time.perf_counter() - waiting, depth=depth)
+        self.max_depths[stage] = max(self.max_depths[stage], depth)
+
+    async def _get(self, stage: str) -> Any:
+        entry = await self._queues[stage].get()
+        if entry is _DONE:
+            return _DONE
+        queued_at, item = entry
+        tracing.record(f"pipeline.{stage}.queued", time.perf_counter() - queued_at)
+        return item
+
+    async def _fetch_worker(self, results: List[Any], kwargs: Dict[str, Any]):
+        while True:
+            item = await self._get("fetch")
+            if item is _DONE:
+                return
+            index, url = item
+            try:
+                raw_data = await self.scraper.fetch(url, **kwargs)
+            except Exception as e:
+                self.logger.error(f"Error fetching {url}: {e}")
+                continue
+            if raw_data and self.scraper.parser:
+                await self._put("parse", (index, url, raw_data))
+            else:
+                results[index] = raw_data
+
+    async def _parse_worker(self, results: List[Any]):
+        while True:
+            item = await self._get("parse")
+            if item is _DONE:
+                return
+            index, url, raw_data = item
+            try:
+                parsed_data = await self.scraper.parser.parse(raw_data)
+            except Exception as e:
+                self.logger.error(f"Error parsing {url}: {e}")
+                continue
+            results[index] = parsed_data
+            if self.scraper.storage and parsed_data:
+                await self._put("store", (url, parsed_data))
+
+    async def _store_worker(self):
+        while True:
+            item = await self._get("store")
+            if item is _DONE:
+                return
+            batch = [item]
+            done = False
+            # Merge already queued list results into one save call
+            while isinstance(item[1], list) and len(batch) < self.store_batch_size:
+                try:
+                    entry = self._queues["store"].get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if entry is _DONE:
+                    done = True
+                    break
+                queued_at, next_item = entry
+                tracing.record("pipeline.store.queued", time.perf_counter() - queued_at)
+                if not isinstance(next_item[1], list):
+                    await self._save([next_item])
+                    continue
+                batch.append(next_item)
+
+            await self._save(batch)
+            if done:
+                return
+
+    async def _save(self, batch: List[Any]):
+        if len(batch) == 1:
+            data = batch[0][1]
+        else:
+            data = [row for _, rows in batch for row in rows]
+        try:
+            if self._store_lock is None:
+                await self.scraper.storage.save(data)
+            else:
+                async with self._store_lock:
+                    await self.scraper.storage.save(data)
+        except Exception as e:
+            urls = ", ".join(url for url, _ in batch)
+            self.logger.error(f"Error storing data of {urls}: {e}")
@@ -0,0 +1,152 @@
+import asyncio
+import threading
+import logging
+from concurrent.futures import Future, TimeoutError
+from typing import Any, Dict, List, Optional
+
+from .http_scraper import HttpScraper
+
+
+class SyncHttpScraper:
+    """
+    Synchronous facade around HttpScraper.
+
+    One event loop runs for the whole lifetime of the facade in a background
+    thread, so the ClientSession, its connection pool and the ProxyManager
+    state survive across calls instead of being rebuilt by every asyncio.run.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Args:
+            *args, **kwargs: Forwarded to HttpScraper
+        """
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run_loop, name="SyncHttpScraperLoop", daemon=True)
+        self._thread.start()
+        self._closed = False
+
+        # Build the scraper on the loop thread so asyncio primitives bind to it
+        try:
+            self.scraper: HttpScraper = self._call(self._create(*args, **kwargs))
+        except BaseException:
+            self._closed = True
+            self._stop_loop()
+            raise
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    async def _create(self, *args, **kwargs) -> HttpScraper:
+        return HttpScraper(*args, **kwargs)
+
+    def _submit(self, coro) -> Future:
+        if self._closed:
+            coro.close()
+            raise RuntimeError("SyncHttpScraper is closed.")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def _call(self, coro, wait_timeout: Optional[float] = None) -> Any:
+        return self._wait(self._submit(coro), wait_timeout)
+
+    @staticmethod
+    def _wait(future: Future, wait_timeout: Optional[float]) -> Any:
+        try:
+            return future.result(wait_timeout)
+        except TimeoutError:
+            # Stop the abandoned coroutine so it releases connections and slots
+            future.cancel()
+            raise
+
+    def fetch_future(self, url: str, **kwargs) -> Future:
+        """
+        Returns:
+            concurrent.futures.Future resolving to the web content
+        """
+        return self._submit(self.scraper.fetch(url, **kwargs))
+
+    def scrape_many_future(self, urls: List[str], concurrency: int = 5, **kwargs) -> Future:
+        """
+        Returns:
+            concurrent.futures.Future resolving to the processed data list
+        """
+        return self._submit(self.scraper.scrape_many(urls, concurrency, **kwargs))
+
+    def get_parsed_data_future(self, urls, *args, **kwargs) -> Future:
+        """
+        Returns:
+            concurrent.futures.Future resolving to {url: parsed data}
+        """
+        return self._submit(self.scraper.get_parsed_data(urls, *args, **kwargs))
+
+    def fetch(self, url: str, wait_timeout: Optional[float] = None, **kwargs) -> Optional[str]:
+        """
+        Blocking version of HttpScraper.fetch
+
+        Args:
+            wait_timeout: Seconds to wait for the result, wait forever if None.
+                The fetch is cancelled when it expires.
+        """
+        return self._wait(self.fetch_future(url, **kwargs), wait_timeout)
+
+    def scrape_many(self, urls: List[str], concurrency: int = 5,
+                    wait_timeout: Optional[float] = None, **kwargs) -> List[Any]:
+        """
+        Blocking version of HttpScraper.scrape_many
+
+        Args:
+            wait_timeout: Seconds to wait for the result, wait forever if None.
+                The batch is cancelled when it expires.
+        """
+        return self._wait(self.scrape_many_future(urls, concurrency, **kwargs), wait_timeout)
+
+    def get_parsed_data(self, urls, *args, wait_timeout: Optional[float] = None,
+                        **kwargs) -> Dict[str, Any]:
+        """
+        Blocking version of HttpScraper.get_parsed_data
+
+        Args:
+            wait_timeout: Seconds to wait for the result, wait forever if None.
+                The batch is cancelled when it expires.
+        """
+        return self._wait(self.get_parsed_data_future(urls, *args, **kwargs), wait_timeout)
+
+    def close(self):
+        """
+        Close the HTTP session and stop the background loop.
+        """
+        if self._closed:
+            return
+        try:
+            self._call(self.scraper.close())
+        except Exception as e:
+            self.logger.error(f"Error closing scraper: {e}")
+        finally:
+            self._closed = True
+            # Futures still waited on by other threads resolve with CancelledError
+            try:
+                asyncio.run_coroutine_threadsafe(self._cancel_pending(), self._loop).result()
+            except Exception as e:
+                self.logger.error(f"Error cancelling pending tasks: {e}")
+            self._stop_loop()
+
+    async def _cancel_pending(self):
+        current = asyncio.current_task()
+        tasks = [task for task in asyncio.all_tasks() if task is not current]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _stop_loop(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
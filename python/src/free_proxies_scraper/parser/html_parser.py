@@ -1,21 +1,51 @@
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import soupsieve
+import hashlib
 from typing import Any, Optional, Callable
-import asyncio
 
 from .base_parser import BaseParser
+from .parse_cache import ParseCache
+from ..utils import tracing
 
 
 class HtmlParser(BaseParser):
-    def __init__(self, selector: Optional[str] = None, parser: str = "html.parser", parse_func: Optional[Callable] = None):
+    def __init__(self, selector: Optional[str] = None, parser: str = "html.parser", parse_func: Optional[Callable] = None,
+                 cache: Optional[ParseCache] = None, parse_only: Optional[SoupStrainer] = None,
+                 cache_key: Optional[str] = None):
         """
         Args:
-            selector: CSS selector
+            selector: CSS selector, compiled once and reused across calls
             parser: Beautiful Soup Parser
             parse_func: Custom parse function
+            cache: Parse result cache, identical content skips parsing if set
+            parse_only: Build only the subtrees matching this strainer,
+                e.g. SoupStrainer("table", class_="table-striped").
+                Not supported by the html5lib parser.
+            cache_key: Name of parse_func in the cache, required when both cache
+                and parse_func are set. Parsers sharing a cache need distinct keys,
+                e.g. functions built by the same factory; bump a version suffix
+                when the function's behaviour changes through state outside its code.
         """
+        if cache is not None and parse_func is not None and not cache_key:
+            raise ValueError("cache_key is required when caching the results of parse_func.")
         self.selector = selector
         self.parser_type = parser
         self.parse_func = parse_func
+        self.cache = cache
+        self.cache_key = cache_key
+        self.parse_only = parse_only
+        self.compiled_selector = soupsieve.compile(selector) if selector else None
+
+    @property
+    def identity(self) -> str:
+        """
+        String identifying this parser configuration, used in cache keys
+        """
+        func = ""
+        if self.parse_func:
+            # Edited function bodies must not hit stale on-disk entries
+            func = f"{self.cache_key}@{_code_fingerprint(self.parse_func)}"
+        return f"{self.__class__.__name__}|{self.parser_type}|{self.selector}|{self.parse_only}|{func}"
 
     async def parse(self, content: str = "", *args, **kwargs) -> Any:
         """
@@ -28,16 +58,57 @@ class HtmlParser(BaseParser):
         if not content:
             return None
 
+        with tracing.span("parse"):
+            return await self._cached_parse(content, *args, **kwargs)
+
+    async def _cached_parse(self, content: str, *args, **kwargs) -> Any:
+        if self.cache is None:
+            return await self._parse(content, *args, **kwargs)
+
+        key = self.cache.make_key(content, self.identity, args, kwargs)
+        found, data = await tracing.run_in_executor("parse.cache_lookup", self.cache.lookup, key)
+        if found:
+            return data
+
+        data = await self._parse(content, *args, **kwargs)
+        await tracing.run_in_executor("parse.cache_store", self.cache.store, key, data)
+        return data
+
+    async def _parse(self, content: str, *args, **kwargs) -> Any:
         # Create async task to protect from blocking
-        if not content:
-            return None
-        loop = asyncio.get_event_loop()
-        soup = await loop.run_in_executor(None, lambda: BeautifulSoup(content, self.parser_type))
+        soup = await tracing.run_in_executor(
+            "parse.soup", lambda: BeautifulSoup(content, self.parser_type, parse_only=self.parse_only))
 
         if self.parse_func:
-            return await loop.run_in_executor(None, lambda: self.parse_func(soup, *args, **kwargs))
+            return await tracing.run_in_executor("parse.parse_func", lambda: self.parse_func(soup, *args, **kwargs))
 
-        if self.selector:
-            return await loop.run_in_executor(None, lambda: soup.select(self.selector))
+        if self.compiled_selector:
+            return await tracing.run_in_executor("parse.select", lambda: self.compiled_selector.select(soup))
 
         return soup
+
+
+def _code_fingerprint(func: Callable) -> str:
+    """
+    Hash the bytecode and constants of func, nested code objects included
+    """
+    func = getattr(func, "__func__", func)
+    code = getattr(func, "__code__", None)
+    if code is None:
+        code = getattr(type(func).__call__, "__code__", None)
+    if code is None:
+        return ""
+
+    h = hashlib.blake2b(digest_size=12)
+
+    def _update(c):
+        h.update(c.co_code)
+        h.update(repr(c.co_names).encode("utf-8"))
+        for const in c.co_consts:
+            if hasattr(const, "co_code"):
+                _update(const)
+            else:
+                h.update(repr(const).encode("utf-8"))
+
+    _update(code)
+    return h.hexdigest()
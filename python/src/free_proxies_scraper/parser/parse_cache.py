@@ -0,0 +1,127 @@
+import hashlib
+import logging
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+
+class ParseCache:
+    """
+    Memoize parse results by a hash of the fetched content plus the parser identity.
+
+    Hot entries live in a bounded in-memory LRU. When cache_dir is set, results
+    that can be pickled are also written to disk so they survive restarts.
+    Cached results are shared between callers and should not be mutated.
+    """
+
+    def __init__(self, max_entries: int = 1024, cache_dir: Optional[str] = None, include_args: bool = True):
+        """
+        Args:
+            max_entries: Maximum number of results kept in memory
+            cache_dir: Directory for the on-disk tier, disabled if None
+            include_args: Include the extra parse arguments (e.g. url) in the key.
+                Disable it when parse_func ignores them so mirrors share entries.
+        """
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.include_args = include_args
+        self.logger = logging.getLogger("ParseCache")
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def make_key(self, content: str, identity: str, args: tuple = (), kwargs: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Args:
+            content: Fetched body
+            identity: String identifying the parser configuration
+
+        Returns:
+            Hex digest used as cache key
+        """
+        h = hashlib.blake2b(digest_size=20)
+        h.update(identity.encode("utf-8"))
+        h.update(b"\0")
+        if self.include_args and (args or kwargs):
+            h.update(repr((args, sorted((kwargs or {}).items()))).encode("utf-8"))
+        h.update(b"\0")
+        h.update(content.encode("utf-8", "surrogatepass"))
+        return h.hexdigest()
+
+    def lookup(self, key: str) -> Tuple[bool, Any]:
+        """
+        Returns:
+            (found, value), value is None when not found
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, self._entries[key]
+
+        found, value = self._load(key)
+        with self._lock:
+            if found:
+                self.hits += 1
+                self._remember(key, value)
+            else:
+                self.misses += 1
+        return found, value
+
+    def store(self, key: str, value: Any):
+        """
+        Store a parse result in memory and, if enabled, on disk.
+        """
+        with self._lock:
+            self._remember(key, value)
+        self._dump(key, value)
+
+    def clear(self):
+        """
+        Drop the in-memory entries. The on-disk tier is left untouched.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: str, value: Any):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + ".pkl")
+
+    def _load(self, key: str) -> Tuple[bool, Any]:
+        if not self.cache_dir:
+            return False, None
+        path = self._path(key)
+        if not os.path.exists(path):
+            return False, None
+        try:
+            with open(path, "rb") as f:
+                return True, pickle.load(f)
+        except Exception as e:
+            self.logger.debug(f"Discarding unreadable cache entry {path}: {e}")
+            return False, None
+
+    def _dump(self, key: str, value: Any):
+        if not self.cache_dir:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            # Soup objects and other unpicklable results stay memory-only
+            self.logger.debug(f"Skipping on-disk cache for {key}: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
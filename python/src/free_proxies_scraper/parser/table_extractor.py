@@ -0,0 +1,123 @@
+from html.parser import HTMLParser
+from typing import Iterable, List, Optional
+
+
+class TableRowExtractor(HTMLParser):
+    """
+    Streaming extractor collecting the cell texts of one HTML table.
+
+    No tree is built: only the rows of the first table matching table_class or
+    table_id are kept, and feeding can stop as soon as that table is closed.
+    """
+
+    def __init__(self, table_class: Optional[str] = None, table_id: Optional[str] = None,
+                 cell_tags: Iterable[str] = ("td",)):
+        """
+        Args:
+            table_class: Class the target table must have
+            table_id: Id the target table must have
+            cell_tags: Tags collected as cells, th is skipped by default
+        """
+        super().__init__(convert_charrefs=True)
+        self.table_class = table_class
+        self.table_id = table_id
+        self.cell_tags = set(cell_tags)
+        self.rows: List[List[str]] = []
+        self.found = False
+        self.done = False
+        # Nesting depth of tables while inside the target, 0 when outside
+        self._depth = 0
+        self._row: Optional[List[str]] = None
+        self._cell: Optional[List[str]] = None
+
+    def _matches(self, attrs) -> bool:
+        attrs = dict(attrs)
+        if self.table_id is not None and attrs.get("id") != self.table_id:
+            return False
+        if self.table_class is not None and self.table_class not in (attrs.get("class") or "").split():
+            return False
+        return True
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "table":
+            if self._depth:
+                self._depth += 1
+            elif self._matches(attrs):
+                self._depth = 1
+                self.found = True
+            return
+        # Rows of nested tables belong to the enclosing cell
+        if self._depth != 1:
+            return
+        if tag == "tr":
+            self._finish_row()
+            self._row = []
+        elif tag in self.cell_tags and self._row is not None:
+            self._finish_cell()
+            self._cell = []
+
+    def handle_endtag(self, tag):
+        if not self._depth:
+            return
+        if tag == "table":
+            self._depth -= 1
+            if not self._depth:
+                self._finish_row()
+                self.done = True
+            return
+        if self._depth != 1:
+            return
+        if tag in self.cell_tags:
+            self._finish_cell()
+        elif tag == "tr":
+            self._finish_row()
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def close(self):
+        super().close()
+        # Keep the last row of a truncated document
+        self._finish_row()
+
+    def _finish_cell(self):
+        if self._cell is not None and self._row is not None:
+            self._row.append("".join(self._cell).strip())
+        self._cell = None
+
+    def _finish_row(self):
+        self._finish_cell()
+        if self._row:
+            self.rows.append(self._row)
+        self._row = None
+
+
+def extract_table_rows(html: str, table_class: Optional[str] = None, table_id: Optional[str] = None,
+                       cell_tags: Iterable[str] = ("td",), chunk_size: int = 65536) -> Optional[List[List[str]]]:
+    """
+    Extract the cell texts of the first matching table without building a DOM.
+
+    Args:
+        html: HTML String
+        table_class: Class the target table must have
+        table_id: Id the target table must have
+        cell_tags: Tags collected as cells
+        chunk_size: Characters fed per step, parsing stops once the table is closed
+
+    Returns:
+        List of rows, each a list of cell texts, None if no table matched
+    """
+    extractor = TableRowExtractor(table_class, table_id, cell_tags)
+    for start in range(0, len(html), chunk_size):
+        extractor.feed(html[start:start + chunk_size])
+        if extractor.done:
+            break
+    else:
+        extractor.close()
+
+    if not extractor.found:
+        return None
+    return extractor.rows
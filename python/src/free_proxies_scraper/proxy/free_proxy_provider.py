@@ -1,18 +1,21 @@
 import aiohttp
 import asyncio
 import logging
-from bs4 import BeautifulSoup
 from typing import List, Optional
 
 from .proxy_provider import ProxyProvider
+from .proxy_validator import ProxyValidator
 from ..utils.user_agent import UserAgentManager
+from ..utils.timeout_policy import AdaptiveTimeoutPolicy
+from ..parser.table_extractor import extract_table_rows
 
 class FreeProxyProvider(ProxyProvider):
     """
     Retrieve proxies from a free proxy website.
     """
     
-    def __init__(self, url: str = "https://www.free-proxy-list.net/", check_url: str = "https://www.google.com", country: str = "US"):
+    def __init__(self, url: str = "https://www.free-proxy-list.net/", check_url: str = "https://www.google.com", country: str = "US",
+                 timeout_policy: Optional[AdaptiveTimeoutPolicy] = None):
         """
         Initialize the free proxy provider.
         
@@ -20,12 +23,15 @@ class FreeProxyProvider(ProxyProvider):
             url: URL of the proxy listing website.
             check_url: URL used to verify proxies.
             country: Country code to filter proxies by.
+            timeout_policy: Policy deriving validation deadlines from observed latencies.
         """
         self.url = url
         self.check_url = check_url
         self.logger = logging.getLogger("FreeProxyProvider")
         self.user_agent_manager = UserAgentManager()
         self.country = country
+        self.validator = ProxyValidator(check_url, timeout_policy, self.user_agent_manager)
+        self.timeout_policy = self.validator.timeout_policy
     
     async def get_proxies(self) -> List[str]:
         """
@@ -39,6 +45,12 @@ class FreeProxyProvider(ProxyProvider):
         self.logger.info(f"Found {len(valid_proxies)} valid proxies out of {len(raw_proxies)} scraped")
         return valid_proxies
     
+    def get_country(self, proxy: str) -> Optional[str]:
+        """
+        All proxies of this provider come from self.country.
+        """
+        return self.country
+    
     async def _scrape_proxies(self) -> List[str]:
         """
         Scrape proxies from the proxy listing website.
@@ -55,22 +67,21 @@ class FreeProxyProvider(ProxyProvider):
                         return []
                     
                     html = await response.text()
-                    soup = BeautifulSoup(html, "html.parser")
                     proxies = []
                     
-                    # Parsing logic for free-proxy-list.net
-                    table = soup.find("table", {"class": "table-striped"})
-                    if not table:
+                    # Parsing logic for free-proxy-list.net, only the table rows are tokenized
+                    loop = asyncio.get_event_loop()
+                    rows = await loop.run_in_executor(None, extract_table_rows, html, "table-striped")
+                    if rows is None:
                         self.logger.error("Proxy table not found")
                         return []
                     
-                    for row in table.tbody.find_all("tr"):
-                        cols = row.find_all("td")
+                    for cols in rows:
                         if len(cols) >= 7:
-                            ip = cols[0].text.strip()
-                            port = cols[1].text.strip()
-                            code = cols[2].text.strip()
-                            https = cols[6].text.strip()
+                            ip = cols[0]
+                            port = cols[1]
+                            code = cols[2]
+                            https = cols[6]
                             if code == self.country and https == "yes":
                                 proxy = f"http://{ip}:{port}"
                                 proxies.append(proxy)
@@ -86,35 +97,10 @@ class FreeProxyProvider(ProxyProvider):
         
         Args:
             proxies: List of proxy URLs to validate.
-            timeout: Timeout in seconds for each proxy check.
+            timeout: Upper bound in seconds for each proxy check.
             concurrent: Number of concurrent validation requests.
         
         Returns:
             List[str]: List of valid proxy URLs.
         """
-        valid_proxies: List[str] = []
-        semaphore = asyncio.Semaphore(concurrent)
-        
-        async def _check_proxy(proxy: str) -> Optional[str]:
-            async with semaphore:
-                try:
-                    headers = {"User-Agent": self.user_agent_manager.get_random()}
-                    async with aiohttp.ClientSession() as session:
-                        async with session.get(
-                            self.check_url,
-                            proxy=proxy,
-                            timeout=aiohttp.ClientTimeout(total=timeout),
-                            headers=headers
-                        ) as response:
-                            if response.status == 200:
-                                self.logger.debug(f"Valid proxy: {proxy}")
-                                return proxy
-                except Exception:
-                    pass
-                return None
-        
-        tasks = [_check_proxy(proxy) for proxy in proxies]
-        results = await asyncio.gather(*tasks)
-        valid_proxies = [p for p in results if p]
-        
-        return valid_proxies
+        return await self.validator.validate(proxies, timeout, concurrent)
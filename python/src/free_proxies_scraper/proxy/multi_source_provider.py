@@ -0,0 +1,137 @@
+import aiohttp
+import asyncio
+import logging
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .proxy_provider import ProxyProvider
+from .proxy_sources import PROXY_SOURCES, ProxySource, get_source
+from .proxy_validator import ProxyValidator
+from ..utils.user_agent import UserAgentManager
+from ..utils.timeout_policy import AdaptiveTimeoutPolicy
+
+
+class MultiSourceProxyProvider(ProxyProvider):
+    """
+    Retrieve proxies from several listing sites concurrently.
+
+    Candidates are deduplicated by ip:port across all sources before
+    validation, so a proxy listed on several sites is only checked once.
+    """
+
+    def __init__(
+        self,
+        sources: Optional[List[Union[str, ProxySource]]] = None,
+        check_url: str = "https://www.google.com",
+        countries: Optional[List[str]] = None,
+        require_https: bool = True,
+        timeout_policy: Optional[AdaptiveTimeoutPolicy] = None
+    ):
+        """
+        Initialize the multi-source proxy provider.
+
+        Args:
+            sources: Registered source names or ProxySource instances, all registered sources if None.
+            check_url: URL used to verify proxies.
+            countries: Country codes to keep, any country if None. Candidates from
+                sources that do not list countries are dropped when set.
+            require_https: Drop candidates a source lists as not supporting HTTPS.
+            timeout_policy: Policy deriving validation deadlines from observed latencies.
+        """
+        self.check_url = check_url
+        self.logger = logging.getLogger("MultiSourceProxyProvider")
+        self.user_agent_manager = UserAgentManager()
+        self.validator = ProxyValidator(check_url, timeout_policy, self.user_agent_manager)
+        self.timeout_policy = self.validator.timeout_policy
+        self.sources = [get_source(s) for s in (sources or list(PROXY_SOURCES))]
+        self.countries = set(countries) if countries else None
+        if self.countries is not None:
+            for source in self.sources:
+                if not source.lists_countries:
+                    self.logger.warning(
+                        f"Source {source.name} does not list countries, "
+                        f"none of its proxies pass the country filter {sorted(self.countries)}")
+        self.require_https = require_https
+        # {proxy_url: country code} of the last scrape
+        self.proxy_countries: Dict[str, Optional[str]] = {}
+
+    async def get_proxies(self) -> List[str]:
+        """
+        Fetch candidates from all sources and validate them once.
+
+        Returns:
+            List[str]: List of valid proxy URLs.
+        """
+        raw_proxies = await self._scrape_proxies()
+        valid_proxies = await self.validator.validate(raw_proxies)
+        self.logger.info(f"Found {len(valid_proxies)} valid proxies out of {len(raw_proxies)} scraped")
+        return valid_proxies
+
+    async def _scrape_proxies(self) -> List[str]:
+        """
+        Scrape all sources concurrently and merge their candidates.
+
+        Returns:
+            List[str]: Deduplicated list of proxy URLs.
+        """
+        async with aiohttp.ClientSession() as session:
+            results = await asyncio.gather(
+                *[self._scrape_source(session, source) for source in self.sources],
+                return_exceptions=True
+            )
+
+        merged: Dict[Tuple[str, int], str] = {}
+        countries: Dict[str, Optional[str]] = {}
+        total = 0
+        for source, result in zip(self.sources, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error scraping proxies from {source.name}: {result}")
+                continue
+            for candidate in result:
+                key = self._dedup_key(candidate)
+                if key is None or not self._accept(candidate):
+                    continue
+                total += 1
+                if key not in merged:
+                    merged[key] = f"http://{key[0]}:{key[1]}"
+                    countries[merged[key]] = candidate.get("country")
+                elif countries[merged[key]] is None:
+                    countries[merged[key]] = candidate.get("country")
+
+        self.proxy_countries = countries
+        self.logger.info(f"Collected {len(merged)} unique candidates out of {total} from {len(self.sources)} sources")
+        return list(merged.values())
+
+    def get_country(self, proxy: str) -> Optional[str]:
+        """
+        Country code listed by the source the proxy was scraped from.
+        """
+        return self.proxy_countries.get(proxy)
+
+    async def _scrape_source(self, session: aiohttp.ClientSession, source: ProxySource) -> List[Dict[str, Any]]:
+        headers = {"User-Agent": self.user_agent_manager.get_random()}
+        async with session.get(source.url, headers=headers) as response:
+            if response.status != 200:
+                self.logger.error(f"Failed to fetch proxies from {source.name}, status code: {response.status}")
+                return []
+            content = await response.text()
+
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, source.extract, content)
+
+    def _accept(self, candidate: Dict[str, Any]) -> bool:
+        if self.countries is not None and candidate.get("country") not in self.countries:
+            return False
+        if self.require_https and candidate.get("https") is False:
+            return False
+        return True
+
+    @staticmethod
+    def _dedup_key(candidate: Dict[str, Any]) -> Optional[Tuple[str, int]]:
+        ip = str(candidate.get("ip", "")).strip()
+        try:
+            port = int(str(candidate.get("port", "")).strip())
+        except ValueError:
+            return None
+        if not ip or not 0 < port < 65536:
+            return None
+        return ip, port
@@ -2,9 +2,24 @@ import asyncio
 import time
 import logging
 import random
-from typing import Optional
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
 
 from .free_proxy_provider import FreeProxyProvider
+from .multi_source_provider import MultiSourceProxyProvider
+from .proxy_provider import ProxyProvider
+from ..utils import tracing
+from ..utils.timeout_policy import AdaptiveTimeoutPolicy
+
+
+# Countries served by free-proxy-list.net providers when none are given
+DEFAULT_COUNTRIES = ["US", "CA"]
+
+
+class NoProxyAvailableError(Exception):
+    """
+    Raised when a proxy from a specific country is requested but none is available.
+    """
 
 
 class ProxyManager:
@@ -15,57 +30,141 @@ class ProxyManager:
     def __init__(
         self,
         check_url: str = "https://www.google.com/",
-        countries: list = ["US", "CA"],
+        countries: Optional[list] = None,
         cooldown_period: int = 120,
-        check_interval: int = 600
+        check_interval: int = 600,
+        sources: Optional[list] = None,
+        providers: Optional[List[ProxyProvider]] = None,
+        sticky_ttl: int = 600,
+        max_sticky: int = 1024,
+        timeout_policy: Optional[AdaptiveTimeoutPolicy] = None
     ):
         """
         Initialize the proxy manager.
 
         Args:
             check_url: URL used to verify proxies.
-            countries: List of country codes to fetch proxies from.
+            countries: List of country codes to fetch proxies from, DEFAULT_COUNTRIES
+                if None. With sources, None keeps proxies from any country.
             cooldown_period: Cooldown time after a proxy failure (in seconds).
             check_interval: Interval for periodic proxy list refresh (in seconds).
+            sources: Proxy source names or ProxySource instances. When set, a single
+                MultiSourceProxyProvider scrapes all of them concurrently and
+                deduplicates candidates before validation.
+            providers: Ready-made providers, overrides countries and sources.
+            sticky_ttl: Seconds a host keeps its proxy since its last use.
+            max_sticky: Maximum number of sticky host assignments kept.
+            timeout_policy: Policy shared with the providers for validation deadlines,
+                usually the one of the scraper. Ignored when providers are given.
         """
-        self.providers = []
-        for country in countries:
-            self.providers.append(
-                FreeProxyProvider(check_url=check_url, country=country)
-            )
-        # Store proxy metadata: {proxy_url: {"last_check": timestamp, "failures": count, "success": count}}
+        if providers is not None:
+            self.providers = list(providers)
+        elif sources is not None:
+            self.providers = [
+                MultiSourceProxyProvider(sources=sources, check_url=check_url, countries=countries,
+                                         timeout_policy=timeout_policy)
+            ]
+        else:
+            self.providers = []
+            for country in countries or DEFAULT_COUNTRIES:
+                self.providers.append(
+                    FreeProxyProvider(check_url=check_url, country=country, timeout_policy=timeout_policy)
+                )
+        # Store proxy metadata: {proxy_url: {"last_check": timestamp, "failures": count, "success": count, "country": code}}
         self.proxies = {}
+        # {country code: set of proxy URLs}
+        self.country_index: Dict[str, Set[str]] = {}
+        # {(host, country): (proxy_url, expiry timestamp)}, oldest first
+        self.sticky: "OrderedDict[Tuple[str, Optional[str]], Tuple[str, float]]" = OrderedDict()
+        self.sticky_ttl = sticky_ttl
+        self.max_sticky = max_sticky
         self.cooldown_period = cooldown_period
         self.check_interval = check_interval
         self.logger = logging.getLogger("ProxyManager")
         self.update_lock = asyncio.Lock()
         self.last_update = 0
 
-    async def get_proxy(self) -> Optional[str]:
+    async def get_proxy(self, country: Optional[str] = None, host: Optional[str] = None) -> Optional[str]:
         """
         Get an available proxy.
 
+        Args:
+            country: Only return proxies from this country code.
+            host: Keep returning the same proxy for this host while it stays
+                healthy and is used within sticky_ttl seconds.
+
         Returns:
-            A proxy URL string, or None if no proxies are available.
+            A proxy URL string, or None if no proxies are available and
+            no country was requested.
+
+        Raises:
+            NoProxyAvailableError: country is set and none of its proxies is available.
         """
+        with tracing.span("proxy.get"):
+            return await self._get_proxy(country, host)
+
+    async def _get_proxy(self, country: Optional[str], host: Optional[str]) -> Optional[str]:
         # Refresh proxy list if it's stale or empty
         if time.time() - self.last_update > self.check_interval or not self.proxies:
             await self.update_proxies()
 
-        available = []
         now = time.time()
+        if host:
+            proxy = self._get_sticky(host, country, now)
+            if proxy:
+                return proxy
+
+        if country:
+            candidates = self.country_index.get(country, ())
+        else:
+            candidates = self.proxies
 
-        for proxy, stats in self.proxies.items():
+        available = []
+        for proxy in candidates:
             # Only include proxies not in cooldown
-            if now - stats.get("last_failure", 0) >= self.cooldown_period:
+            if self._is_available(proxy, now):
+                stats = self.proxies[proxy]
                 score = stats.get("success", 0) - stats.get("failures", 0)
                 available.append((proxy, score))
 
         if not available:
+            if country:
+                # A direct connection would come from the wrong region
+                raise NoProxyAvailableError(f"No available proxies for {country}.")
             self.logger.warning(
                 "No available proxies. Falling back to direct connection.")
             return None
 
+        proxy = self._choose(available)
+        if host:
+            self._set_sticky(host, country, proxy, now)
+        return proxy
+
+    def _is_available(self, proxy: str, now: float) -> bool:
+        stats = self.proxies.get(proxy)
+        return stats is not None and now - stats.get("last_failure", 0) >= self.cooldown_period
+
+    def _get_sticky(self, host: str, country: Optional[str], now: float) -> Optional[str]:
+        key = (host, country)
+        entry = self.sticky.get(key)
+        if entry is None:
+            return None
+        proxy, expiry = entry
+        # Failed or expired assignments are replaced by a fresh pick
+        if expiry < now or not self._is_available(proxy, now):
+            del self.sticky[key]
+            return None
+        self._set_sticky(host, country, proxy, now)
+        return proxy
+
+    def _set_sticky(self, host: str, country: Optional[str], proxy: str, now: float):
+        key = (host, country)
+        self.sticky[key] = (proxy, now + self.sticky_ttl)
+        self.sticky.move_to_end(key)
+        while len(self.sticky) > self.max_sticky:
+            self.sticky.popitem(last=False)
+
+    def _choose(self, available: List[Tuple[str, int]]) -> str:
         # Weighted selection based on success/failure history
         weights = [max(1, score + 5) for _, score in available]
         total = sum(weights)
@@ -109,6 +208,10 @@ class ProxyManager:
         """
         Refresh the list of proxies from all providers.
         """
+        with tracing.span("proxy.update"):
+            await self._update_proxies()
+
+    async def _update_proxies(self):
         async with self.update_lock:
             # Avoid concurrent updates
             if time.time() - self.last_update < self.check_interval:
@@ -134,9 +237,18 @@ class ProxyManager:
                         new_proxies[proxy] = {
                             "last_check": time.time(),
                             "failures": 0,
-                            "success": 0
+                            "success": 0,
+                            "country": provider.get_country(proxy)
                         }
+                    elif new_proxies[proxy].get("country") is None:
+                        new_proxies[proxy]["country"] = provider.get_country(proxy)
+
+            country_index: Dict[str, Set[str]] = {}
+            for proxy, stats in new_proxies.items():
+                if stats.get("country"):
+                    country_index.setdefault(stats["country"], set()).add(proxy)
 
             self.proxies = new_proxies
+            self.country_index = country_index
             self.last_update = time.time()
             self.logger.info(f"Proxy list updated. Total proxies: {len(self.proxies)}")
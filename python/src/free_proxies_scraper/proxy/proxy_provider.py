@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional
 
 
 class ProxyProvider(ABC):
@@ -12,3 +12,12 @@ class ProxyProvider(ABC):
             URL list
         """
         pass
+
+    def get_country(self, proxy: str) -> Optional[str]:
+        """
+        Get the country code of a proxy returned by get_proxies
+
+        Returns:
+            Country code, None if unknown
+        """
+        return None
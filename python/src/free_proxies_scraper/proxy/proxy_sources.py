@@ -0,0 +1,149 @@
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union
+
+from ..parser.table_extractor import extract_table_rows
+
+
+class ProxySource:
+    """
+    Describe a proxy listing page and how to pull candidates out of it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        url: str,
+        fmt: str = "table",
+        table_class: Optional[str] = None,
+        table_id: Optional[str] = None,
+        ip_col: int = 0,
+        port_col: int = 1,
+        country_col: Optional[int] = None,
+        https_col: Optional[int] = None,
+        https_value: str = "yes",
+        row_parser: Optional[Callable[[str], Iterable[Dict[str, Any]]]] = None
+    ):
+        """
+        Args:
+            name: Unique source name used by the registry.
+            url: URL of the listing page.
+            fmt: "table" for HTML tables, "text" for plain ip:port lists.
+            table_class: Class of the listing table.
+            table_id: Id of the listing table.
+            ip_col: Column holding the IP address.
+            port_col: Column holding the port.
+            country_col: Column holding the country code, None if not listed.
+            https_col: Column telling whether HTTPS is supported, None if not listed.
+            https_value: Value of https_col meaning HTTPS is supported.
+            row_parser: Custom extraction function returning candidate dicts,
+                overrides fmt and the column spec when set.
+        """
+        if fmt not in ("table", "text"):
+            raise ValueError(f"Unsupported source format: {fmt}")
+        self.name = name
+        self.url = url
+        self.fmt = fmt
+        self.table_class = table_class
+        self.table_id = table_id
+        self.ip_col = ip_col
+        self.port_col = port_col
+        self.country_col = country_col
+        self.https_col = https_col
+        self.https_value = https_value
+        self.row_parser = row_parser
+
+    @property
+    def lists_countries(self) -> bool:
+        """
+        Whether candidates of this source can carry a country code.
+        Custom row parsers are assumed to fill it in.
+        """
+        if self.row_parser:
+            return True
+        return self.fmt == "table" and self.country_col is not None
+
+    def extract(self, content: str) -> List[Dict[str, Any]]:
+        """
+        Args:
+            content: Body of the listing page
+
+        Returns:
+            Candidates as {"ip", "port", "country", "https"} dicts,
+            country and https are None when the source does not list them
+        """
+        if self.row_parser:
+            return list(self.row_parser(content))
+        if self.fmt == "text":
+            return self._extract_text(content)
+        return self._extract_table(content)
+
+    def _extract_table(self, content: str) -> List[Dict[str, Any]]:
+        rows = extract_table_rows(content, self.table_class, self.table_id)
+        if rows is None:
+            return []
+
+        needed = max(c for c in (self.ip_col, self.port_col, self.country_col, self.https_col) if c is not None)
+        candidates = []
+        for cols in rows:
+            if len(cols) <= needed:
+                continue
+            https = None
+            if self.https_col is not None:
+                https = cols[self.https_col].lower() == self.https_value.lower()
+            candidates.append({
+                "ip": cols[self.ip_col],
+                "port": cols[self.port_col],
+                "country": cols[self.country_col] if self.country_col is not None else None,
+                "https": https
+            })
+        return candidates
+
+    @staticmethod
+    def _extract_text(content: str) -> List[Dict[str, Any]]:
+        return [
+            {"ip": ip, "port": port, "country": None, "https": None}
+            for ip, port in _IP_PORT_PATTERN.findall(content)
+        ]
+
+    def __repr__(self):
+        return f"ProxySource({self.name!r}, {self.url!r})"
+
+
+_IP_PORT_PATTERN = re.compile(r"\b(\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5})\b")
+
+
+# Sites sharing the free-proxy-list.net markup
+_FREE_PROXY_LIST_SPEC = dict(table_class="table-striped", ip_col=0, port_col=1, country_col=2, https_col=6)
+
+PROXY_SOURCES: Dict[str, ProxySource] = {}
+
+
+def register_source(source: ProxySource, replace: bool = False) -> ProxySource:
+    """
+    Add a source to the registry.
+
+    Args:
+        source: Source to register.
+        replace: Overwrite a source registered under the same name.
+    """
+    if source.name in PROXY_SOURCES and not replace:
+        raise ValueError(f"Proxy source already registered: {source.name}")
+    PROXY_SOURCES[source.name] = source
+    return source
+
+
+def get_source(source: Union[str, ProxySource]) -> ProxySource:
+    """
+    Resolve a registered source name, ProxySource instances are returned as is.
+    """
+    if isinstance(source, ProxySource):
+        return source
+    try:
+        return PROXY_SOURCES[source]
+    except KeyError:
+        raise KeyError(f"Unknown proxy source: {source}") from None
+
+
+register_source(ProxySource("free-proxy-list", "https://www.free-proxy-list.net/", **_FREE_PROXY_LIST_SPEC))
+register_source(ProxySource("sslproxies", "https://www.sslproxies.org/", **_FREE_PROXY_LIST_SPEC))
+register_source(ProxySource("us-proxy", "https://www.us-proxy.org/", **_FREE_PROXY_LIST_SPEC))
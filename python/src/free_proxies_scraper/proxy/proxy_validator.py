@@ -0,0 +1,86 @@
+import aiohttp
+import asyncio
+import logging
+import time
+from typing import List, Optional
+from urllib.parse import urlsplit
+
+from ..utils.user_agent import UserAgentManager
+from ..utils.timeout_policy import AdaptiveTimeoutPolicy
+
+
+class ProxyValidator:
+    """
+    Check that proxies can reach check_url, shared by the proxy providers.
+    """
+
+    def __init__(self, check_url: str = "https://www.google.com", timeout_policy: Optional[AdaptiveTimeoutPolicy] = None,
+                 user_agent_manager: Optional[UserAgentManager] = None):
+        """
+        Initialize the proxy validator.
+
+        Args:
+            check_url: URL used to verify proxies.
+            timeout_policy: Policy deriving validation deadlines from observed latencies.
+            user_agent_manager: User-Agent source, a default one if None.
+        """
+        self.check_url = check_url
+        self.timeout_policy = timeout_policy or AdaptiveTimeoutPolicy(
+            default_timeout=5, min_timeout=0.5)
+        self.user_agent_manager = user_agent_manager or UserAgentManager()
+        self.logger = logging.getLogger("ProxyValidator")
+
+    async def validate(self, proxies: List[str], timeout: int = 5, concurrent: int = 10) -> List[str]:
+        """
+        Validate proxies to ensure they are usable.
+
+        Args:
+            proxies: List of proxy URLs to validate.
+            timeout: Upper bound in seconds for each proxy check.
+            concurrent: Number of concurrent validation requests.
+
+        Returns:
+            List[str]: List of valid proxy URLs.
+        """
+        valid_proxies: List[str] = []
+        semaphore = asyncio.Semaphore(concurrent)
+        host = urlsplit(self.check_url).netloc
+
+        # Freeze deadlines before the batch starts: the fastest proxies answer
+        # first and must not tighten the deadline of the remaining candidates
+        check_timeouts = {}
+        for proxy in proxies:
+            check_timeout = self.timeout_policy.get_timeout(proxy, host)
+            if check_timeout.total is None or check_timeout.total > timeout:
+                check_timeout = aiohttp.ClientTimeout(total=timeout)
+            check_timeouts[proxy] = check_timeout
+
+        async def _check_proxy(proxy: str) -> Optional[str]:
+            async with semaphore:
+                check_timeout = check_timeouts[proxy]
+                try:
+                    headers = {"User-Agent": self.user_agent_manager.get_random()}
+                    async with aiohttp.ClientSession() as session:
+                        start = time.monotonic()
+                        async with session.get(
+                            self.check_url,
+                            proxy=proxy,
+                            timeout=check_timeout,
+                            headers=headers
+                        ) as response:
+                            if response.status == 200:
+                                self.timeout_policy.record(
+                                    time.monotonic() - start, 0.0, proxy, host)
+                                self.logger.debug(f"Valid proxy: {proxy}")
+                                return proxy
+                except asyncio.TimeoutError:
+                    self.timeout_policy.record_timeout(check_timeout, proxy, host)
+                except Exception:
+                    pass
+                return None
+
+        tasks = [_check_proxy(proxy) for proxy in proxies]
+        results = await asyncio.gather(*tasks)
+        valid_proxies = [p for p in results if p]
+
+        return valid_proxies
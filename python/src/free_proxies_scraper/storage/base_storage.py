@@ -5,6 +5,9 @@ from typing import Any
 class BaseStorage(ABC):
     """BaseStorage Class"""
 
+    # Whether save may be called again before a previous call has finished
+    supports_concurrent_save = False
+
     @abstractmethod
     async def save(self, data: Any) -> bool:
         """
@@ -3,6 +3,8 @@ import asyncio
 import os
 from typing import List, Dict, Any, Optional
 from .base_storage import BaseStorage
+from ..utils import tracing
+from ..utils.compression import infer_compression, open_text
 
 
 class CsvStorage(BaseStorage):
@@ -10,7 +12,8 @@ class CsvStorage(BaseStorage):
     CSV Storage implementation for cases when fieldnames are predetermined.
     """
 
-    def __init__(self, file_path: str, fieldnames: Optional[List[str]] = None, mode: str = "a"):
+    def __init__(self, file_path: str, fieldnames: Optional[List[str]] = None, mode: str = "a",
+                 compression: Optional[str] = "infer", compression_level: Optional[int] = None):
         """
         Initialize CSV storage.
 
@@ -18,10 +21,17 @@ class CsvStorage(BaseStorage):
             file_path: Path to the CSV file.
             fieldnames: List of column names for the CSV.
             mode: File open mode, "a" for append and "w" for overwrite.
+            compression: "gzip", "zstd" or None for plain text. "infer" picks it
+                from the file extension (.gz, .zst).
+            compression_level: Codec compression level, codec default if None.
         """
         self.file_path = file_path
         self.fieldnames = fieldnames
         self.mode = mode
+        if compression == "infer":
+            compression = infer_compression(file_path)
+        self.compression = compression
+        self.compression_level = compression_level
 
     async def save(self, data: Any) -> bool:
         """
@@ -51,7 +61,6 @@ class CsvStorage(BaseStorage):
             raise ValueError(
                 "Fieldnames are empty. Set it in the CSVStorage instance creation stage.")
 
-        loop = asyncio.get_event_loop()
         try:
             # Check if the file exists; if not, prepare to create it with a header
             file_exists = os.path.exists(self.file_path)
@@ -65,7 +74,8 @@ class CsvStorage(BaseStorage):
                 write_mode = "w"  # Always create a new file if it doesn't exist
 
             # Use executor to avoid blocking the event loop
-            await loop.run_in_executor(None, self._write_to_csv, data, write_mode, not file_exists)
+            with tracing.span("storage.save", rows=len(data)):
+                await tracing.run_in_executor("storage.write", self._write_to_csv, data, write_mode, not file_exists)
             return True
         except Exception as e:
             print(f"Error saving to CSV: {e}")
@@ -73,7 +83,7 @@ class CsvStorage(BaseStorage):
 
     def _write_to_csv(self, data, write_mode, write_header):
         """Perform CSV writing in a background thread."""
-        with open(self.file_path, write_mode, newline='', encoding='utf-8') as csvfile:
+        with open_text(self.file_path, write_mode, self.compression, self.compression_level) as csvfile:
             if not data:
                 return
 
@@ -113,7 +123,7 @@ class CsvStorage(BaseStorage):
     def _read_from_csv(self):
         """Perform CSV reading in a background thread."""
         data = []
-        with open(self.file_path, 'r', newline='', encoding='utf-8') as csvfile:
+        with open_text(self.file_path, 'r', self.compression) as csvfile:
             reader = csv.DictReader(csvfile)
             self.fieldnames = reader.fieldnames
             for row in reader:
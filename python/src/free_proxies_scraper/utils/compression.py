@@ -0,0 +1,109 @@
+import gzip
+import importlib.util
+import io
+from typing import IO, Optional
+
+
+def _has_module(name: str) -> bool:
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def _aiohttp_supports(flag: str, fallback: bool) -> bool:
+    try:
+        from aiohttp import compression_utils
+    except ImportError:
+        return fallback
+    return bool(getattr(compression_utils, flag, fallback))
+
+
+def accept_encoding() -> str:
+    """
+    Build the Accept-Encoding header from the codecs aiohttp can decode here.
+    aiohttp decompresses the body while streaming it, so no extra step is needed.
+
+    Returns:
+        Accept-Encoding header value
+    """
+    encodings = ["gzip", "deflate"]
+    if _aiohttp_supports("HAS_BROTLI", _has_module("brotli") or _has_module("brotlicffi")):
+        encodings.append("br")
+    # aiohttp (3.12+) decodes zstd with compression.zstd on Python 3.14+ or
+    # backports.zstd before, and reports it as HAS_ZSTD; zstandard is only
+    # used for CSV files, so it does not count here
+    if _aiohttp_supports("HAS_ZSTD", False):
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+def infer_compression(file_path: str) -> Optional[str]:
+    """
+    Returns:
+        "gzip" or "zstd" based on the file extension, None for plain files
+    """
+    lower = file_path.lower()
+    if lower.endswith((".gz", ".gzip")):
+        return "gzip"
+    if lower.endswith((".zst", ".zstd")):
+        return "zstd"
+    return None
+
+
+def open_text(file_path: str, mode: str, compression: Optional[str] = None, level: Optional[int] = None,
+              encoding: str = "utf-8", newline: Optional[str] = "") -> IO[str]:
+    """
+    Open a possibly compressed file in text mode. Appending adds a new gzip member
+    or zstd frame, which readers decode as one continuous stream.
+
+    Args:
+        file_path: Path to the file
+        mode: "r", "w" or "a"
+        compression: None, "gzip" or "zstd"
+        level: Compression level, codec default if None
+        encoding: Text encoding
+        newline: Passed to the text wrapper, "" for csv
+
+    Returns:
+        Text file object
+    """
+    if mode not in ("r", "w", "a"):
+        raise ValueError(f"Unsupported mode: {mode}")
+
+    if compression is None:
+        return open(file_path, mode, newline=newline, encoding=encoding)
+
+    if compression == "gzip":
+        return gzip.open(file_path, mode + "t", compresslevel=9 if level is None else level,
+                         encoding=encoding, newline=newline)
+
+    if compression == "zstd":
+        return _open_zstd(file_path, mode, level, encoding, newline)
+
+    raise ValueError(f"Unsupported compression: {compression}")
+
+
+def _open_zstd(file_path: str, mode: str, level: Optional[int], encoding: str, newline: Optional[str]) -> IO[str]:
+    try:
+        # Python 3.14+
+        from compression import zstd
+        options = {} if level is None else {"level": level}
+        return zstd.open(file_path, mode + "t", encoding=encoding, newline=newline, **options)
+    except ImportError:
+        pass
+
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "zstd compression requires the 'zstandard' package: pip install free-proxies-scraper[compression]") from None
+
+    raw = open(file_path, mode + "b")
+    if mode == "r":
+        stream = zstandard.ZstdDecompressor().stream_reader(raw, read_across_frames=True, closefd=True)
+        return io.TextIOWrapper(io.BufferedReader(stream), encoding=encoding, newline=newline)
+
+    compressor = zstandard.ZstdCompressor(level=3 if level is None else level)
+    stream = compressor.stream_writer(raw, closefd=True)
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline, write_through=True)
@@ -0,0 +1,175 @@
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional, Tuple
+
+import aiohttp
+
+
+class AdaptiveTimeoutPolicy:
+    """
+    Derive request deadlines from observed latencies.
+
+    Latencies are tracked in bounded windows per proxy, per (proxy, host) route,
+    per host across all proxies and per host for direct requests. Once a key has
+    enough samples, its connect and read deadlines become a multiple of the
+    chosen quantile, clamped between min_timeout and max_timeout.
+
+    Direct host latencies say nothing about how slow a proxy is, so a proxied
+    request is tightened by the proxy's own history, or by the pooled history
+    of proxied requests to the host for proxies not seen yet. The direct host
+    estimate only serves as a lower bound. Requests without enough history fall
+    back to default_timeout. Timeouts are recorded as censored samples equal to
+    the deadline that expired, so deadlines loosen again when they are too tight.
+    """
+
+    def __init__(
+        self,
+        default_timeout: float = 10,
+        quantile: float = 0.95,
+        multiplier: float = 3.0,
+        min_timeout: float = 1.0,
+        max_timeout: Optional[float] = None,
+        window: int = 50,
+        min_samples: int = 5
+    ):
+        """
+        Args:
+            default_timeout: Total timeout (seconds) used without enough samples
+            quantile: Latency quantile the deadlines are derived from
+            multiplier: Factor applied to the quantile
+            min_timeout: Floor for each derived deadline (seconds)
+            max_timeout: Ceiling for the total deadline, default_timeout if None
+            window: Number of samples kept per key
+            min_samples: Samples required before a key's stats are used
+        """
+        if not 0 < quantile <= 1:
+            raise ValueError("quantile should be in (0, 1].")
+        self.default_timeout = default_timeout
+        self.quantile = quantile
+        self.multiplier = multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout if max_timeout is not None else default_timeout
+        self.window = window
+        self.min_samples = min_samples
+        # {key: (connect samples, read samples)}
+        self._samples: Dict[Tuple, Tuple[Deque[float], Deque[float]]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, connect_time: float, read_time: float,
+               proxy: Optional[str] = None, host: Optional[str] = None):
+        """
+        Record the latency of a successful request.
+
+        Args:
+            connect_time: Seconds until response headers arrived
+            read_time: Seconds spent reading the body
+            proxy: Proxy URL used, if any
+            host: Target host
+        """
+        keys = self._keys(proxy, host)
+        if proxy and host:
+            keys.append(("proxied_host", host))
+        with self._lock:
+            for key in keys:
+                if key not in self._samples:
+                    self._samples[key] = (deque(maxlen=self.window),
+                                          deque(maxlen=self.window))
+                connect, read = self._samples[key]
+                connect.append(connect_time)
+                read.append(read_time)
+
+    def record_timeout(self, timeout: aiohttp.ClientTimeout,
+                       proxy: Optional[str] = None, host: Optional[str] = None):
+        """
+        Record a request that hit its deadline as a censored sample.
+
+        Args:
+            timeout: The ClientTimeout the request was sent with
+            proxy: Proxy URL used, if any
+            host: Target host
+        """
+        total = timeout.total if timeout.total is not None else self.max_timeout
+        self.record(timeout.sock_connect or total, timeout.sock_read or total, proxy, host)
+
+    def get_deadlines(self, proxy: Optional[str] = None,
+                      host: Optional[str] = None) -> Optional[Tuple[float, float]]:
+        """
+        Returns:
+            (connect deadline, read deadline) in seconds, None without enough samples
+        """
+        with self._lock:
+            if proxy:
+                estimates = [self._estimate(key) for key in self._keys(proxy, host)]
+                estimates = [e for e in estimates if e is not None]
+                if not estimates and host:
+                    # Prior for a new proxy: how fast any proxy reached this host
+                    prior = self._estimate(("proxied_host", host))
+                    if prior is not None:
+                        estimates.append(prior)
+                if not estimates:
+                    return None
+                # The direct host latency only bounds a proxied request from below
+                floor = self._estimate(("host", host)) if host else None
+                if floor is not None:
+                    estimates.append(floor)
+            else:
+                estimate = self._estimate(("host", host)) if host else None
+                if estimate is None:
+                    return None
+                estimates = [estimate]
+
+        # Be conservative when the estimates disagree
+        connect = max(e[0] for e in estimates) * self.multiplier
+        read = max(e[1] for e in estimates) * self.multiplier
+        return self._clamp(connect), self._clamp(read)
+
+    def get_timeout(self, proxy: Optional[str] = None,
+                    host: Optional[str] = None) -> aiohttp.ClientTimeout:
+        """
+        Returns:
+            aiohttp.ClientTimeout for a request through proxy to host
+        """
+        deadlines = self.get_deadlines(proxy, host)
+        if deadlines is None:
+            return aiohttp.ClientTimeout(total=self.default_timeout)
+
+        connect, read = deadlines
+        # sock_read also covers the wait for the first byte of the response
+        return aiohttp.ClientTimeout(
+            total=min(self.max_timeout, connect + read),
+            sock_connect=connect,
+            sock_read=max(connect, read)
+        )
+
+    def forget(self, proxy: Optional[str] = None, host: Optional[str] = None):
+        """
+        Drop the samples kept for a proxy, a route or a host's direct requests.
+        The pooled proxied samples of a host are kept.
+        """
+        with self._lock:
+            for key in self._keys(proxy, host):
+                self._samples.pop(key, None)
+
+    @staticmethod
+    def _keys(proxy: Optional[str], host: Optional[str]):
+        # Direct and proxied latencies of a host are kept apart
+        if not proxy:
+            return [("host", host)] if host else []
+        keys = [("proxy", proxy)]
+        if host:
+            keys.append(("route", proxy, host))
+        return keys
+
+    def _estimate(self, key: Tuple) -> Optional[Tuple[float, float]]:
+        samples = self._samples.get(key)
+        if not samples or len(samples[0]) < self.min_samples:
+            return None
+        return self._quantile(samples[0]), self._quantile(samples[1])
+
+    def _quantile(self, samples: Deque[float]) -> float:
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.quantile * len(ordered)))
+        return ordered[index]
+
+    def _clamp(self, value: float) -> float:
+        return max(self.min_timeout, min(self.max_timeout, value))
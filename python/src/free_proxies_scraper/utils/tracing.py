@@ -0,0 +1,333 @@
+import asyncio
+import contextvars
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+
+_current_tracer: contextvars.ContextVar = contextvars.ContextVar("tracer", default=None)
+# Stack of open span frames [name, children time], per task
+_current_stack: contextvars.ContextVar = contextvars.ContextVar("span_stack", default=())
+
+
+class SummarySink:
+    """
+    Aggregate span durations per stage in memory.
+    """
+
+    def __init__(self, window: int = 1024):
+        """
+        Args:
+            window: Number of recent durations kept per stage for quantiles
+        """
+        self.window = window
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]):
+        duration = record["duration"]
+        with self._lock:
+            stats = self.stats.get(record["name"])
+            if stats is None:
+                stats = self.stats[record["name"]] = {
+                    "count": 0, "total": 0.0, "max": 0.0, "recent": deque(maxlen=self.window)}
+            stats["count"] += 1
+            stats["total"] += duration
+            stats["max"] = max(stats["max"], duration)
+            stats["recent"].append(duration)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns:
+            {stage: {"count", "total", "mean", "p50", "p95", "max"}}, durations in seconds
+        """
+        result = {}
+        with self._lock:
+            for name, stats in self.stats.items():
+                recent = sorted(stats["recent"])
+                result[name] = {
+                    "count": stats["count"],
+                    "total": stats["total"],
+                    "mean": stats["total"] / stats["count"],
+                    "p50": recent[min(len(recent) - 1, int(0.5 * len(recent)))],
+                    "p95": recent[min(len(recent) - 1, int(0.95 * len(recent)))],
+                    "max": stats["max"],
+                }
+        return result
+
+    def format(self) -> str:
+        """
+        Returns:
+            Summary as a text table sorted by total time
+        """
+        lines = [f"{'stage':<28}{'count':>8}{'total(s)':>12}{'mean(ms)':>12}{'p95(ms)':>12}{'max(ms)':>12}"]
+        for name, s in sorted(self.summary().items(), key=lambda item: -item[1]["total"]):
+            lines.append(f"{name:<28}{s['count']:>8}{s['total']:>12.3f}{s['mean'] * 1000:>12.1f}"
+                         f"{s['p95'] * 1000:>12.1f}{s['max'] * 1000:>12.1f}")
+        return "\n".join(lines)
+
+
+class JsonLinesSink:
+    """
+    Append one JSON object per span to a file.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Args:
+            file_path: Path to the output file
+        """
+        self.file_path = file_path
+        self._file = open(file_path, "a", encoding="utf-8")
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]):
+        line = json.dumps({
+            "name": record["name"],
+            "stack": ";".join(record["stack"]),
+            "start": record["start"],
+            "duration": record["duration"],
+            "attrs": record["attrs"],
+        }, default=str)
+        with self._lock:
+            self._file.write(line + "\n")
+
+    def close(self):
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+
+class FoldedStackSink:
+    """
+    Accumulate self time per span stack in the folded format read by
+    flamegraph.pl, inferno and speedscope ("a;b;c <microseconds>").
+    """
+
+    def __init__(self):
+        self.stacks: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def emit(self, record: Dict[str, Any]):
+        key = ";".join(record["stack"] + (record["name"],))
+        with self._lock:
+            self.stacks[key] = self.stacks.get(key, 0.0) + record["self_time"]
+
+    def format(self) -> str:
+        with self._lock:
+            return "\n".join(f"{stack} {int(seconds * 1e6)}" for stack, seconds in sorted(self.stacks.items()))
+
+    def dump(self, file_path: str):
+        """
+        Write the folded stacks to file_path.
+        """
+        with open(file_path, "w", encoding="utf-8") as f:
+            f.write(self.format() + "\n")
+
+
+class Tracer:
+    """
+    Time pipeline stages and hand the spans to pluggable sinks.
+
+    A sink is any object with an emit(record) method. Records are dicts with
+    name, stack (names of the enclosing spans), start (epoch seconds),
+    duration and self_time (seconds) and attrs.
+    """
+
+    def __init__(self, sinks: Optional[List[Any]] = None):
+        """
+        Args:
+            sinks: Span sinks, a SummarySink if None
+        """
+        self.sinks = sinks if sinks is not None else [SummarySink()]
+        self.logger = logging.getLogger("Tracer")
+
+    @contextmanager
+    def activate(self):
+        """
+        Make this tracer the one used by span() in the current context.
+        """
+        token = _current_tracer.set(self)
+        try:
+            yield self
+        finally:
+            _current_tracer.reset(token)
+
+    @contextmanager
+    def span(self, name: str, **attrs):
+        """
+        Time the enclosed block as a stage called name.
+        """
+        stack = _current_stack.get()
+        frame = [name, 0.0]
+        token = _current_stack.set(stack + (frame,))
+        start_wall = time.time()
+        start = time.perf_counter()
+        try:
+            yield attrs
+        finally:
+            duration = time.perf_counter() - start
+            _current_stack.reset(token)
+            if stack:
+                stack[-1][1] += duration
+            self._emit(name, stack, start_wall, duration, max(0.0, duration - frame[1]), attrs)
+
+    def record(self, name: str, duration: float, **attrs):
+        """
+        Record an already measured stage under the current span.
+        """
+        stack = _current_stack.get()
+        if stack:
+            # Counted as child time so the parent's self time excludes it
+            stack[-1][1] += duration
+        self._emit(name, stack, time.time() - duration, duration, duration, attrs)
+
+    def _emit(self, name, stack, start, duration, self_time, attrs):
+        record = {
+            "name": name,
+            "stack": tuple(frame[0] for frame in stack),
+            "start": start,
+            "duration": duration,
+            "self_time": self_time,
+            "attrs": attrs,
+        }
+        for sink in self.sinks:
+            try:
+                sink.emit(record)
+            except Exception as e:
+                self.logger.error(f"Error emitting span to {sink.__class__.__name__}: {e}")
+
+
+def get_tracer() -> Optional[Tracer]:
+    """
+    Returns:
+        Tracer active in the current context, None if tracing is off
+    """
+    return _current_tracer.get()
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Time the enclosed block with the active tracer, no-op if tracing is off.
+    """
+    tracer = _current_tracer.get()
+    if tracer is None:
+        yield attrs
+        return
+    with tracer.span(name, **attrs) as span_attrs:
+        yield span_attrs
+
+
+def record(name: str, duration: float, **attrs):
+    """
+    Record an already measured stage with the active tracer, no-op if tracing is off.
+    """
+    tracer = _current_tracer.get()
+    if tracer is not None:
+        tracer.record(name, duration, **attrs)
+
+
+async def run_in_executor(name: str, func, *args):
+    """
+    Run func in the default executor, recording queueing and run time separately
+    as "<name>.queue" and "<name>.run".
+    """
+    loop = asyncio.get_event_loop()
+    if _current_tracer.get() is None:
+        return await loop.run_in_executor(None, func, *args)
+
+    submitted = time.perf_counter()
+    started = []
+
+    def _timed():
+        started.append(time.perf_counter())
+        return func(*args)
+
+    try:
+        return await loop.run_in_executor(None, _timed)
+    finally:
+        if started:
+            record(f"{name}.queue", started[0] - submitted)
+            record(f"{name}.run", time.perf_counter() - started[0])
+
+
+class LoopLagMonitor:
+    """
+    Detect event loop lag caused by blocking calls.
+
+    A heartbeat task sleeps for interval and measures how late it wakes up.
+    Lags above threshold are logged and recorded as "loop.lag" spans. With
+    debug set, asyncio also logs every callback running longer than threshold,
+    naming the blocking call.
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.05,
+                 tracer: Optional[Tracer] = None, debug: bool = False):
+        """
+        Args:
+            interval: Heartbeat period in seconds
+            threshold: Lag in seconds reported as blocking
+            tracer: Tracer receiving the lag spans, the active one if None
+            debug: Enable asyncio debug mode to name slow callbacks
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.tracer = tracer
+        self.debug = debug
+        self.logger = logging.getLogger("LoopLagMonitor")
+        self.max_lag = 0.0
+        self.lag_count = 0
+        self._task = None
+        # (loop, debug flag, slow_callback_duration) to restore on stop
+        self._saved_debug = None
+
+    async def start(self):
+        if self._task is not None and not self._task.done():
+            return
+        loop = asyncio.get_event_loop()
+        if self.debug:
+            self._saved_debug = (loop, loop.get_debug(), loop.slow_callback_duration)
+            loop.set_debug(True)
+            loop.slow_callback_duration = self.threshold
+        self.tracer = self.tracer or get_tracer()
+        self._task = loop.create_task(self._run())
+
+    async def stop(self):
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._saved_debug is not None:
+            # Debug mode is expensive, do not leave it on after monitoring
+            loop, debug, slow_callback_duration = self._saved_debug
+            loop.set_debug(debug)
+            loop.slow_callback_duration = slow_callback_duration
+            self._saved_debug = None
+
+    async def _run(self):
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            lag = time.perf_counter() - start - self.interval
+            self.max_lag = max(self.max_lag, lag)
+            if lag > self.threshold:
+                self.lag_count += 1
+                self.logger.warning(f"Event loop blocked for {lag * 1000:.1f}ms")
+                if self.tracer:
+                    self.tracer.record("loop.lag", lag)
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.stop()
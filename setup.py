@@ -17,7 +17,13 @@ setup(
     install_requires=[
         "beautifulsoup4",
         "aiohttp",
+        "soupsieve",
     ],
+    extras_require={
+        # brotli and backports.zstd let aiohttp decode br/zstd responses,
+        # zstandard writes and reads .zst CSV files
+        "compression": ["brotli", "zstandard", 'backports.zstd; python_version < "3.14"'],
+    },
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -0,0 +1,38 @@
+import os
+import sys
+
+import pytest
+
+# Import the package from the source tree when it is not installed
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python", "src"))
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Saved listing page of each registered source, plus a plain ip:port list
+SOURCE_FIXTURES = {
+    "free-proxy-list": "free_proxy_list.html",
+    "sslproxies": "sslproxies.html",
+    "us-proxy": "us_proxy.html",
+    "text": "proxies.txt",
+}
+
+
+def _read(file_name):
+    with open(os.path.join(FIXTURES, file_name), encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.fixture
+def source_fixtures():
+    """
+    {source name: fixture file name}
+    """
+    return dict(SOURCE_FIXTURES)
+
+
+@pytest.fixture
+def source_page():
+    """
+    Return a function reading the saved page of a source by name.
+    """
+    return lambda name: _read(SOURCE_FIXTURES[name])
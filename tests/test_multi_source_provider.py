@@ -0,0 +1,111 @@
+import asyncio
+import logging
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from free_proxies_scraper.proxy.multi_source_provider import MultiSourceProxyProvider
+from free_proxies_scraper.proxy.proxy_manager import ProxyManager
+from free_proxies_scraper.proxy.proxy_sources import ProxySource
+
+TEXT_SOURCE = ProxySource("text", "http://localhost/proxies.txt", fmt="text")
+
+
+@pytest.fixture
+def make_provider(source_page):
+    def _make(**kwargs):
+        provider = MultiSourceProxyProvider(
+            sources=["free-proxy-list", "sslproxies", "us-proxy", TEXT_SOURCE], **kwargs)
+
+        async def _scrape_source(session, source):
+            return source.extract(source_page(source.name))
+
+        provider._scrape_source = _scrape_source
+        return provider
+
+    return _make
+
+
+@pytest.mark.parametrize("candidate,key", [
+    ({"ip": "10.0.0.1", "port": "8080"}, ("10.0.0.1", 8080)),
+    ({"ip": " 10.0.0.1 ", "port": " 80 "}, ("10.0.0.1", 80)),
+    ({"ip": "10.0.0.1", "port": "99999"}, None),
+    ({"ip": "10.0.0.1", "port": "0"}, None),
+    ({"ip": "10.0.0.1", "port": "abc"}, None),
+    ({"ip": "", "port": "80"}, None),
+])
+def test_dedup_key(candidate, key):
+    assert MultiSourceProxyProvider._dedup_key(candidate) == key
+
+
+def test_accept_https_filter():
+    provider = MultiSourceProxyProvider(sources=[])
+
+    assert provider._accept({"country": "US", "https": True})
+    assert provider._accept({"country": None, "https": None})
+    assert not provider._accept({"country": "US", "https": False})
+    assert MultiSourceProxyProvider(sources=[], require_https=False)._accept({"https": False})
+
+
+def test_accept_country_filter():
+    provider = MultiSourceProxyProvider(sources=[], countries=["US"])
+
+    assert provider._accept({"country": "US", "https": True})
+    assert not provider._accept({"country": "CA", "https": True})
+    # Sources that do not list countries cannot satisfy a country filter
+    assert not provider._accept({"country": None, "https": None})
+
+
+def test_scrape_proxies_merges_and_dedups(make_provider):
+    provider = make_provider()
+    proxies = asyncio.run(provider._scrape_proxies())
+
+    # 10.0.0.1 is listed by all three table sources, 10.0.0.2 by a table and the text list
+    assert proxies == [
+        "http://10.0.0.1:8080",
+        "http://10.0.0.2:3128",
+        "http://10.0.0.6:443",
+        "http://10.0.0.7:8888",
+        "http://10.0.0.8:8000",
+    ]
+    assert provider.get_country("http://10.0.0.2:3128") == "CA"
+    assert provider.get_country("http://10.0.0.8:8000") is None
+
+
+def test_scrape_proxies_country_filter(make_provider):
+    provider = make_provider(countries=["US"])
+    proxies = asyncio.run(provider._scrape_proxies())
+
+    assert proxies == ["http://10.0.0.1:8080", "http://10.0.0.7:8888"]
+
+
+def test_scrape_proxies_source_error(make_provider):
+    provider = make_provider()
+    scrape_source = provider._scrape_source
+
+    async def _failing(session, source):
+        if source.name == "sslproxies":
+            raise RuntimeError("boom")
+        return await scrape_source(session, source)
+
+    provider._scrape_source = _failing
+    proxies = asyncio.run(provider._scrape_proxies())
+
+    assert "http://10.0.0.6:443" not in proxies
+    assert "http://10.0.0.1:8080" in proxies
+
+
+def test_country_filter_warns_about_sources_without_countries(caplog):
+    with caplog.at_level(logging.WARNING, logger="MultiSourceProxyProvider"):
+        MultiSourceProxyProvider(sources=["us-proxy", TEXT_SOURCE], countries=["US"])
+
+    assert [r.getMessage().split(",")[0] for r in caplog.records] == ["Source text does not list countries"]
+
+
+def test_manager_passes_countries_only_when_given():
+    manager = ProxyManager(sources=["us-proxy", TEXT_SOURCE])
+    assert manager.providers[0].countries is None
+
+    manager = ProxyManager(sources=["us-proxy"], countries=["US"])
+    assert manager.providers[0].countries == {"US"}
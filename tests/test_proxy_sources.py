@@ -0,0 +1,69 @@
+import pytest
+
+from free_proxies_scraper.proxy.proxy_sources import PROXY_SOURCES, ProxySource, get_source, register_source
+
+
+def test_every_registered_source_has_a_fixture(source_fixtures):
+    assert set(PROXY_SOURCES) <= set(source_fixtures)
+
+
+@pytest.mark.parametrize("name", sorted(PROXY_SOURCES))
+def test_extract_table_sources(name, source_page):
+    candidates = get_source(name).extract(source_page(name))
+
+    assert candidates
+    # Only the table-striped rows are read, the header row has no td cells
+    assert all(c["ip"].startswith("10.0.0.") for c in candidates)
+    assert candidates[0] == {"ip": "10.0.0.1", "port": "8080", "country": "US", "https": True}
+
+
+def test_extract_table_https_column(source_page):
+    candidates = get_source("free-proxy-list").extract(source_page("free-proxy-list"))
+    by_ip = {c["ip"]: c for c in candidates}
+
+    assert by_ip["10.0.0.2"]["country"] == "CA"
+    assert by_ip["10.0.0.3"]["https"] is False
+    # Bad ports are left to the provider
+    assert by_ip["10.0.0.4"]["port"] == "99999"
+
+
+def test_extract_table_missing():
+    assert get_source("free-proxy-list").extract("<html><body><p>maintenance</p></body></html>") == []
+
+
+def test_extract_text(source_page):
+    source = ProxySource("text", "http://localhost/proxies.txt", fmt="text")
+
+    assert source.extract(source_page("text")) == [
+        {"ip": "10.0.0.2", "port": "3128", "country": None, "https": None},
+        {"ip": "10.0.0.8", "port": "8000", "country": None, "https": None},
+        {"ip": "10.0.0.9", "port": "0", "country": None, "https": None},
+    ]
+
+
+def test_extract_row_parser():
+    source = ProxySource("custom", "http://localhost/", row_parser=lambda content: [{"ip": content, "port": "1"}])
+
+    assert source.extract("10.0.0.1") == [{"ip": "10.0.0.1", "port": "1"}]
+
+
+def test_lists_countries():
+    assert get_source("free-proxy-list").lists_countries
+    assert not ProxySource("text", "http://localhost/", fmt="text").lists_countries
+    assert not ProxySource("table", "http://localhost/").lists_countries
+    assert ProxySource("custom", "http://localhost/", row_parser=list).lists_countries
+
+
+def test_unsupported_format():
+    with pytest.raises(ValueError):
+        ProxySource("json", "http://localhost/", fmt="json")
+
+
+def test_registry():
+    source = ProxySource("free-proxy-list", "http://localhost/")
+
+    with pytest.raises(ValueError):
+        register_source(source)
+    with pytest.raises(KeyError):
+        get_source("missing")
+    assert get_source(source) is source